@@ -2,6 +2,7 @@ import io
 import re
 from collections import UserDict
 from datetime import date, datetime
+from operator import itemgetter
 
 from PIL import Image
 from ascii_magic import AsciiArt
@@ -60,7 +61,7 @@ class InvalidPhotoFormatError(InvalidPropertyFormatError):
 
 
 class Field:
-    """Base class for storing Record fields.
+    """Base class for storing Record and Note fields.
 
     Args:
         value: Stored value of arbitary type.
@@ -227,16 +228,19 @@ class Photo(Field):
             if img.mode == 'RGBA':
                 img = img.convert('RGB')
             img.save(img_byte_arr, format="JPEG")
-        except e:
+        except (OSError, ValueError) as e:
             raise InvalidPhotoFormatError from e
         self.value = img_byte_arr.getvalue()
 
-    def render(self, columns: int = 120, width_ratio: float = 2.125):
+    def render(self, columns: int = 120, width_ratio: float = 2.125) -> str:
         """Return bg/fg-colored string representation of photo.
 
         Args:
             columns (int): Width of the output in charactres.
-            width_ration (float): Terminal-specific character ratio.
+            width_ratio (float): Terminal-specific character ratio.
+
+        Returns:
+            str: ASCII string representation of the photo.
         """
         art = AsciiArt(Image.open(io.BytesIO(self.value)))
         return utils.get_truecolor_string(art, columns=columns, width_ratio=width_ratio)
@@ -253,6 +257,9 @@ class Record:
         email (Field)
         photo (Field)
 
+    Every property attribute is always set (None while unset), so callers
+    read them directly without `getattr` defaults.
+
     Args:
         name: Name field value.
     """
@@ -399,11 +406,12 @@ class AddressBook(UserDict):
         Raises:
             KeyError: If key not found during referencing.
         """
-        self.data[name].name.set_value(new_name)
+        record = self.data[name]
+        record.name.set_value(new_name)
         # Preserve position during dict key change
-        self.data = {new_name if key == name else key: val for key, val in self.data.items()}
+        self.data = {new_name if val is record else key: val for key, val in self.data.items()}
 
-    def get_record(self, name: str = None) -> Record | None:
+    def get_record(self, name: str | None = None) -> Record | None:
         """Return Record by name.
 
         Args:
@@ -414,7 +422,7 @@ class AddressBook(UserDict):
         """
         return self.data.get(name)
 
-    def find(self, search_value: str = None) -> dict:
+    def find(self, search_value: str) -> dict[str, Record]:
         """Find all Records matching search value.
 
         Searchable fields: name, birthday, phones, email, address.
@@ -423,11 +431,11 @@ class AddressBook(UserDict):
             search_value (str): Matching value to find.
 
         Returns:
-            list[Record]: List of matched Records.
+            dict[str, Record]: Matched Records by name.
         """
         records = {}
         search_value = search_value.lower()
-        for record in self.values():
+        for record in self.data.values():
             if (
                 search_value in record.name.value.lower() or
                 (record.birthday and search_value in str(record.birthday)) or
@@ -450,6 +458,7 @@ class AddressBook(UserDict):
                     "record": Record,
                     "congratulation_date": date,
                     "wait_days_count": int,
+                    "next_age": int,
                 }
         """
         result = []
@@ -493,4 +502,5 @@ class AddressBook(UserDict):
                 })
 
         # Sort results by congratulation_date
-        return sorted(result, key=lambda d: d["congratulation_date"])
+        result.sort(key=itemgetter("congratulation_date"))
+        return result
@@ -1,8 +1,9 @@
 import functools
 import json
+import os
 import pickle
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
 
 from collections import defaultdict
 from cryptography.fernet import Fernet
@@ -14,6 +15,10 @@ from contacts import AddressBook, Record, InvalidPropertyFormatError
 from notes import NoteBook, Note
 
 
+BG_MAGENTA = "\x1b[45m"  # set background to magenta
+BG_RESET = "\x1b[49m"  # reset only background (keeps other styles)
+
+
 class InvalidCmdArgsCountError(ValueError):
     """Custom exception for invalid cmd args count."""
 
@@ -109,14 +114,32 @@ def input_error(func: Callable) -> Callable:
     return inner
 
 
+def unpack_args(args: Sequence[str | None], count: int) -> Sequence[str | None]:
+    """Return first cmd arguments for unpacking.
+
+    Args:
+        args (Sequence[str | None]): Raw cmd arguments.
+        count (int): Number of arguments to return.
+
+    Returns:
+        Sequence[str | None]: First `count` cmd arguments.
+
+    Raises:
+        InvalidCmdArgsCountError: If args has fewer items than expected.
+    """
+    if len(args) < count:
+        raise InvalidCmdArgsCountError
+    return args[:count]
+
+
 @input_error
-def handle_new_record(args: list[str], book: AddressBook) -> str:
+def handle_new_record(args: Sequence[str | None], book: AddressBook) -> str:
     """Handle new-record command.
 
     Create new Record.
 
     Args:
-        args (list[str]): List with raw cmd arguments.
+        args (Sequence[str | None]): Raw cmd arguments.
             Expected: [name].
         book (AddressBook): AddressBook object.
 
@@ -125,26 +148,21 @@ def handle_new_record(args: list[str], book: AddressBook) -> str:
 
     Raises:
         InvalidCmdArgsCountError: If command has invalid argument count.
+        RecordExistsError: If Record with such name already exists.
         InvalidPropertyFormatError: If name format is invalid.
     """
-    try:
-        name, *_ = args
-    except:
-        raise InvalidCmdArgsCountError
-
-    record = book.get_record(name)
+    name, = unpack_args(args, 1)
 
     # Don't allow to overwrite existing Record
-    if record is not None:
+    if name in book.data:
         raise RecordExistsError
 
-    record = Record(name)
-    book.add_record(record)
+    book.add_record(Record(name))
     return f"New `{name}` Record was created."
 
 
 @input_error
-def handle_records(args: list[str], book: AddressBook) -> str:
+def handle_records(args: Sequence[str | None], book: AddressBook) -> str:
     """Handle record commands: all, show, rename, delete.
 
     If args is empty:
@@ -156,7 +174,7 @@ def handle_records(args: list[str], book: AddressBook) -> str:
         If value is empty string, then delete specified Record.
 
     Args:
-        args (list[str]): List with raw cmd arguments.
+        args (Sequence[str | None]): Raw cmd arguments.
             Expected: [] or [name] or [name, value] or [name, ""].
         book (AddressBook): AddressBook object.
 
@@ -166,16 +184,14 @@ def handle_records(args: list[str], book: AddressBook) -> str:
     Raises:
         InvalidCmdArgsCountError: If command has invalid argument count.
         RecordNotExistsError: If specified Record doesn't exist.
+        RecordExistsError: If Record with new name already exists.
         InvalidPropertyFormatError: If new name format is invalid.
     """
-    try:
-        name, value, *_ = args
-    except:
-        raise InvalidCmdArgsCountError
+    name, value = unpack_args(args, 2)
 
     # Handle ShowAll functionality
     if name is None:
-        return render_records("All Records", book) if book else "No Records."
+        return render_records("All Records", book.data.values()) if book else "No Records."
 
     record = book.get_record(name)
 
@@ -185,20 +201,23 @@ def handle_records(args: list[str], book: AddressBook) -> str:
 
     # Handle Show functionality
     if value is None:
-        return render_records(str(record.name), {0: record})
+        return render_records(str(record.name), (record,))
 
     # Handle Delete functionality
     if value == "":
         book.delete_record(name)
         return f"Deleted `{name}` Record."
 
-    # Handle Rename functionality
+    # Handle Rename functionality. Don't allow to overwrite existing Record
+    if value != name and value in book.data:
+        raise RecordExistsError
+
     book.rename_record(name, value)
     return f"Renamed `{name}` Record to `{value}`."
 
 
 @input_error
-def handle_phone(args: list[str], book: AddressBook) -> str:
+def handle_phone(args: Sequence[str | None], book: AddressBook) -> str:
     """Handle phone commands: show, add, replace, delete.
 
     If args has 1 item:
@@ -210,7 +229,7 @@ def handle_phone(args: list[str], book: AddressBook) -> str:
         If new value is empty string, then delete specified phone.
 
     Args:
-        args (list[str]): List with raw cmd arguments.
+        args (Sequence[str | None]): Raw cmd arguments.
             Expected: [record_name] or [record_name, value] or
             [record_name, value, replace_value] or
             [record_name, value, ""].
@@ -225,10 +244,7 @@ def handle_phone(args: list[str], book: AddressBook) -> str:
         PhoneNotExistsError: If specified phone doesn't exist.
         InvalidPropertyFormatError: If new phone format is invalid.
     """
-    try:
-        name, value, replace_value, *_ = args
-    except:
-        raise InvalidCmdArgsCountError
+    name, value, replace_value = unpack_args(args, 3)
 
     record = book.get_record(name)
 
@@ -263,7 +279,7 @@ def handle_phone(args: list[str], book: AddressBook) -> str:
 
 
 @input_error
-def handle_record_prop(prop: str, args: list[str], book: AddressBook) -> str:
+def handle_record_prop(prop: str, args: Sequence[str | None], book: AddressBook) -> str:
     """Handle Record property commands: show, set, unset.
 
     If args has 1 item:
@@ -273,7 +289,9 @@ def handle_record_prop(prop: str, args: list[str], book: AddressBook) -> str:
         If new value is empty string, then unset property field.
 
     Args:
-        args (list[str]): List with raw cmd arguments.
+        prop (str): Record property name.
+        args (Sequence[str | None]): Raw cmd arguments.
+            Expected: [name] or [name, value] or [name, ""].
         book (AddressBook): AddressBook object.
 
     Returns:
@@ -284,10 +302,7 @@ def handle_record_prop(prop: str, args: list[str], book: AddressBook) -> str:
         RecordNotExistsError: If specified Record doesn't exist.
         InvalidPropertyFormatError: If property format is invalid.
     """
-    try:
-        name, value, *_ = args
-    except:
-        raise InvalidCmdArgsCountError
+    name, value = unpack_args(args, 2)
 
     record = book.get_record(name)
 
@@ -313,6 +328,51 @@ def handle_record_prop(prop: str, args: list[str], book: AddressBook) -> str:
     return f"Set {prop} to `{value}` for the `{name}` Record."
 
 
+def make_table(title: str) -> Table:
+    """Create empty table with common app styling.
+
+    Args:
+        title (str): Table title.
+
+    Returns:
+        Table: Table object ready for columns and rows.
+    """
+    return Table(title=title, border_style="blue", min_width=50, show_lines=True, box=box.SQUARE)
+
+
+def render_table(table: Table) -> str:
+    """Render table into string.
+
+    Args:
+        table (Table): Table object to render.
+
+    Returns:
+        str: Rendered table.
+    """
+    console = Console(record=True, color_system="standard")
+    with console.capture() as capture:
+        console.print(table)
+    return capture.get()
+
+
+def highlight_keyword(output: str, keyword: str | None) -> str:
+    """Highlight keyword occurrences in rendered output.
+
+    Args:
+        output (str): Rendered output.
+        keyword (str | None): Keyword to highlight. Falsy value disables highlighting.
+
+    Returns:
+        str: Output with highlighted keyword occurrences.
+    """
+    if not keyword:
+        return output
+
+    # Highlight all occurrences, except those which start with `
+    pattern = re.compile(rf"(?<!`){re.escape(keyword)}", re.IGNORECASE)
+    return pattern.sub(lambda m: f"{BG_MAGENTA}{m.group(0)}{BG_RESET}", output)
+
+
 def render_phones(record: Record) -> str:
     """Render phones table for the specified Record.
 
@@ -323,30 +383,26 @@ def render_phones(record: Record) -> str:
         str: Rendered phones table.
     """
     title = f"{record.name} : Phone Numbers"
-    tbox = box.SQUARE
-    table = Table(title=title, border_style="blue", min_width=50, show_lines=True, box=tbox)
+    table = make_table(title)
     table.add_column("", style="white", no_wrap=True)
     table.add_column("Phone Number", style="cyan", no_wrap=True)
     for i, phone in enumerate(record.phones):
         table.add_row(str(i), phone.value)
 
-    console = Console(record=True, color_system="standard")
-    with console.capture() as capture:
-        console.print(table)
-    return capture.get()
+    return render_table(table)
 
 
-def render_birthdays(title: str, birthdays: list) -> str:
-    """Render birthdays dict.
+def render_birthdays(title: str, birthdays: list[dict]) -> str:
+    """Render birthdays table.
 
     Args:
-        birthdays (dict): Dictionary with Record birthday info.
+        title (str): Table title.
+        birthdays (list[dict]): List with Record birthday info.
 
     Returns:
         str: Rendered birthdays.
     """
-    tbox = box.SQUARE
-    table = Table(title=title, border_style="blue", min_width=50, show_lines=True, box=tbox)
+    table = make_table(title)
     table.add_column("Name", style="white", no_wrap=True)
     table.add_column("Congratulation Date", style="yellow", no_wrap=True)
     table.add_column("Days Left", style="cyan", no_wrap=True)
@@ -356,29 +412,27 @@ def render_birthdays(title: str, birthdays: list) -> str:
         congrats_date = str(row["congratulation_date"])
         table.add_row(name, congrats_date, str(row["wait_days_count"]), str(row["next_age"]))
 
-    console = Console(record=True, color_system="standard")
-    with console.capture() as capture:
-        console.print(table)
-    return capture.get()
+    return render_table(table)
 
 
-def render_records(title: str, records: dict, keyword_highlight: str = None) -> str:
+def render_records(title: str, records: Iterable[Record], keyword_highlight: str | None = None) -> str:
     """Render Records table.
 
     Args:
-        record (Record): Record object.
+        title (str): Table title.
+        records (Iterable[Record]): Records to render.
+        keyword_highlight (str | None): Keyword to highlight in the output.
 
     Returns:
-        str: Rendered Record "view".
+        str: Rendered Record "views".
     """
-    tbox = box.SQUARE
-    table = Table(title=title, border_style="blue", min_width=50, show_lines=True, box=tbox)
+    table = make_table(title)
     table.add_column("Name", style="white", no_wrap=True)
     table.add_column("Birthday", style="yellow", no_wrap=True)
     table.add_column("Address", style="cyan")
     table.add_column("Email", style="yellow", no_wrap=True)
     table.add_column("Phone Numbers", style="cyan")
-    for record in records.values():
+    for record in records:
         name_str = str(record.name)
         birthday_str = str(record.birthday) if record.birthday else ""
         address_str = str(record.address) if record.address else ""
@@ -386,99 +440,56 @@ def render_records(title: str, records: dict, keyword_highlight: str = None) ->
         phones_str = " ; ".join(phone.value for phone in record.phones) if record.phones else ""
         table.add_row(name_str, birthday_str, address_str, email_str, phones_str)
 
-    console = Console(record=True, color_system="standard")
-    with console.capture() as capture:
-        console.print(table)
-    output = capture.get()
-
-    if not keyword_highlight:
-        return output
-
-    BG_MAGENTA = "\x1b[45m"  # set background to magenta
-    BG_RESET  = "\x1b[49m"  # reset only background (keeps other styles)
+    return highlight_keyword(render_table(table), keyword_highlight)
 
-    # Highlight all occurrences, except those which start with `
-    pattern = re.compile(rf"(?<!`){re.escape(keyword_highlight)}", re.IGNORECASE)
-    return pattern.sub(lambda m: f"{BG_MAGENTA}{m.group(0)}{BG_RESET}", output)
 
-
-def render_notes(title: str, notes: dict, keyword_highlight: str = None) -> str:
+def render_notes(title: str, notes: Iterable[Note], keyword_highlight: str | None = None) -> str:
     """Render Notes table.
 
     Args:
-        notes (dict): dict of Notes.
+        title (str): Table title.
+        notes (Iterable[Note]): Notes to render.
+        keyword_highlight (str | None): Keyword to highlight in the output.
 
     Returns:
         str: Rendered Notes table.
     """
-    tbox = box.SQUARE
-    table = Table(title=title, border_style="blue", min_width=50, show_lines=True, box=tbox)
+    table = make_table(title)
     table.add_column("ID", style="white", no_wrap=True)
     table.add_column("Body Text", style="cyan", no_wrap=True)
     table.add_column("Tags", style="yellow")
-    for note in notes.values():
+    for note in notes:
         id_str = str(note.id)
         body_str = str(note.body) if note.body else ""
         tags_str = " ; ".join(tag.value for tag in note.tags) if note.tags else ""
         table.add_row(id_str, body_str, tags_str)
 
-    console = Console(record=True, color_system="standard")
-    with console.capture() as capture:
-        console.print(table)
-    output = capture.get()
-
-    if not keyword_highlight:
-        return output
+    return highlight_keyword(render_table(table), keyword_highlight)
 
-    BG_MAGENTA = "\x1b[45m"  # set background to magenta
-    BG_RESET  = "\x1b[49m"  # reset only background (keeps other styles)
-
-    # Highlight all occurrences, except those which start with `
-    pattern = re.compile(rf"(?<!`){re.escape(keyword_highlight)}", re.IGNORECASE)
-    return pattern.sub(lambda m: f"{BG_MAGENTA}{m.group(0)}{BG_RESET}", output)
 
-
-def render_notes_by_tags(notes: dict) -> str:
+def render_notes_by_tags(notes: Iterable[Note]) -> str:
     """Render Notes sorted by Tags tables.
 
     Args:
-        notes (dict): dict of Notes.
+        notes (Iterable[Note]): Notes to render.
 
     Returns:
-        str: Rendered Notes sorted by tags tables.
+        str: Rendered Notes sorted by tags tables. Empty if no Note has tags.
     """
-    # Collect list of all available tags
+    # Collect Notes for each available tag in a single pass
     all_tags = defaultdict(list)
-    for note in notes.values():
-        if note.tags:
-            for tag in note.tags:
-                all_tags[tag.value].append(note)
-
-    output = ""
-    for tag in all_tags:
-        tbox = box.SQUARE
-        table = Table(title=f"[magenta]Notes by Tag: {tag}[/magenta]", border_style="blue", min_width=50, show_lines=True, box=tbox)
-        table.add_column("ID", style="white", no_wrap=True)
-        table.add_column("Body Text", style="cyan", no_wrap=True)
-        table.add_column("Tags", style="yellow")
-        for note in notes.values():
-            for note_tag in note.tags:
-                if note_tag.value == tag:
-                    id_str = str(note.id)
-                    body_str = str(note.body) if note.body else ""
-                    tags_str = " ; ".join(tag.value for tag in note.tags) if note.tags else ""
-                    table.add_row(id_str, body_str, tags_str)
-
-        console = Console(record=True, color_system="standard")
-        with console.capture() as capture:
-            console.print(table)
-        output += capture.get()
-
-    return output
+    for note in notes:
+        for tag in note.tags:
+            all_tags[tag.value].append(note)
+
+    return "".join(
+        render_notes(f"[magenta]Notes by Tag: {tag}[/magenta]", tag_notes)
+        for tag, tag_notes in all_tags.items()
+    )
 
 
 @input_error
-def handle_birthdays(args: list[str], book: AddressBook) -> str:
+def handle_birthdays(args: Sequence[str | None], book: AddressBook) -> str:
     """Handle birthdays command.
 
     If args is empty:
@@ -489,7 +500,7 @@ def handle_birthdays(args: list[str], book: AddressBook) -> str:
         within specified range in days.
 
     Args:
-        args (list[str]): List with raw cmd arguments.
+        args (Sequence[str | None]): Raw cmd arguments.
         book (AddressBook): AddressBook object.
 
     Returns:
@@ -499,10 +510,7 @@ def handle_birthdays(args: list[str], book: AddressBook) -> str:
         InvalidCmdArgsCountError: If command has invalid argument count.
         InvalidCmdArgTypeError: If input argument has wrong type.
     """
-    try:
-        days, *_ = args
-    except:
-        raise InvalidCmdArgsCountError
+    days, = unpack_args(args, 1)
 
     # Validate input and apply default if needed
     try:
@@ -515,13 +523,13 @@ def handle_birthdays(args: list[str], book: AddressBook) -> str:
 
 
 @input_error
-def handle_find_records(args: list[str], book: AddressBook) -> str:
+def handle_find_records(args: Sequence[str | None], book: AddressBook) -> str:
     """Handle find-records command.
 
     Search Records by all supported fields.
 
     Args:
-        args (list[str]): List with raw cmd arguments.
+        args (Sequence[str | None]): Raw cmd arguments.
             Expected: [keyword].
         book (AddressBook): AddressBook object.
 
@@ -531,10 +539,7 @@ def handle_find_records(args: list[str], book: AddressBook) -> str:
     Raises:
         InvalidCmdArgsCountError: If command has invalid argument count.
     """
-    try:
-        keyword, *_ = args
-    except:
-        raise InvalidCmdArgsCountError
+    keyword, = unpack_args(args, 1)
 
     records = book.find(keyword)
 
@@ -542,17 +547,17 @@ def handle_find_records(args: list[str], book: AddressBook) -> str:
         return f"No Record matches for the `{keyword}` keyword."
 
     # Render all matched Records
-    return render_records(f"Records matching `{keyword}`", records, keyword)
+    return render_records(f"Records matching `{keyword}`", records.values(), keyword)
 
 
 @input_error
-def handle_new_note(args: list[str], notebook: NoteBook) -> str:
+def handle_new_note(args: Sequence[str | None], notebook: NoteBook) -> str:
     """Handle new-note command.
 
     Create new Note.
 
     Args:
-        args (list[str]): List with raw cmd arguments.
+        args (Sequence[str | None]): Raw cmd arguments.
             Expected: [body].
         notebook (NoteBook): NoteBook object.
 
@@ -563,10 +568,7 @@ def handle_new_note(args: list[str], notebook: NoteBook) -> str:
         InvalidCmdArgsCountError: If command has invalid argument count.
         InvalidPropertyFormatError: If body format is invalid.
     """
-    try:
-        body, *_ = args
-    except:
-        raise InvalidCmdArgsCountError
+    body, = unpack_args(args, 1)
 
     note = Note(body)
     notebook.add_note(note)
@@ -574,7 +576,7 @@ def handle_new_note(args: list[str], notebook: NoteBook) -> str:
 
 
 @input_error
-def handle_notes(args: list[str], notebook: NoteBook) -> str:
+def handle_notes(args: Sequence[str | None], notebook: NoteBook) -> str:
     """Handle note commands: all, show, update, or delete.
 
     If args is empty:
@@ -586,7 +588,7 @@ def handle_notes(args: list[str], notebook: NoteBook) -> str:
         If value is empty string, then delete specified Note.
 
     Args:
-        args (list[str]): List with raw cmd arguments.
+        args (Sequence[str | None]): Raw cmd arguments.
             Expected: [] or [id] or [id, body] or [id, ""]
         notebook (NoteBook): NoteBook object.
 
@@ -599,14 +601,11 @@ def handle_notes(args: list[str], notebook: NoteBook) -> str:
         InvalidCmdArgTypeError: If ID is not a valid integer.
         InvalidPropertyFormatError: If new body format is invalid.
     """
-    try:
-        id_, body, *_ = args
-    except:
-        raise InvalidCmdArgsCountError
+    id_, body = unpack_args(args, 2)
 
     # Handle ShowAll functionality
     if id_ is None:
-        return render_notes("All Notes", notebook) if notebook else "No Notes."
+        return render_notes("All Notes", notebook.data.values()) if notebook else "No Notes."
 
     # Validate `id` argument
     try:
@@ -624,7 +623,7 @@ def handle_notes(args: list[str], notebook: NoteBook) -> str:
 
     # Handle Show functionality
     if body is None:
-        return render_notes("", {0: note})
+        return render_notes("", (note,))
 
     # Handle Delete functionality
     if body == "":
@@ -637,7 +636,7 @@ def handle_notes(args: list[str], notebook: NoteBook) -> str:
 
 
 @input_error
-def handle_tag(args: list[str], notebook: NoteBook) -> str:
+def handle_tag(args: Sequence[str | None], notebook: NoteBook) -> str:
     """Handle tag command: show, add, replace, delete.
 
     If args has 1 item:
@@ -649,7 +648,7 @@ def handle_tag(args: list[str], notebook: NoteBook) -> str:
         If new value is empty string, then delete specified tag.
 
     Args:
-        args (list[str]): List with raw cmd arguments.
+        args (Sequence[str | None]): Raw cmd arguments.
             Expected: [note_id] or [note_id, value] or
             [note_id, value, replace_value] or [note_id, value, ""].
         notebook (NoteBook): NoteBook object.
@@ -664,10 +663,7 @@ def handle_tag(args: list[str], notebook: NoteBook) -> str:
         InvalidCmdArgTypeError: If ID is not a valid integer.
         InvalidPropertyFormatError: If new body format is invalid.
     """
-    try:
-        note_id, value, replace_value, *_ = args
-    except:
-        raise InvalidCmdArgsCountError
+    note_id, value, replace_value = unpack_args(args, 3)
 
     # Validate `id` argument
     try:
@@ -711,13 +707,13 @@ def handle_tag(args: list[str], notebook: NoteBook) -> str:
 
 
 @input_error
-def handle_find_notes(args: list[str], notebook: NoteBook) -> str:
+def handle_find_notes(args: Sequence[str | None], notebook: NoteBook) -> str:
     """Handle find-notes command.
 
     Search Notes by all supported fields.
 
     Args:
-        args (list[str]): List with raw cmd arguments.
+        args (Sequence[str | None]): Raw cmd arguments.
             Expected: [keyword].
         notebook (NoteBook): NoteBook object.
 
@@ -727,10 +723,7 @@ def handle_find_notes(args: list[str], notebook: NoteBook) -> str:
     Raises:
         InvalidCmdArgsCountError: If command has invalid argument count.
     """
-    try:
-        keyword, *_ = args
-    except:
-        raise InvalidCmdArgsCountError
+    keyword, = unpack_args(args, 1)
 
     notes = notebook.find(keyword)
 
@@ -738,52 +731,49 @@ def handle_find_notes(args: list[str], notebook: NoteBook) -> str:
         return f"No Note matches for the `{keyword}` keyword."
 
     # Render all matched Notes
-    return render_notes(f"Notes matching `{keyword}`", notes, keyword)
+    return render_notes(f"Notes matching `{keyword}`", notes.values(), keyword)
 
 
 @input_error
-def handle_sort_by_tags(args: list[str], notebook: NoteBook) -> str:
+def handle_sort_by_tags(args: Sequence[str | None], notebook: NoteBook) -> str:
     """Handle sort-by-tag command.
 
     Sort Notes by tags.
 
     Args:
-        args (list[str]): List with raw cmd arguments.
-            Expected: [tag].
+        args (Sequence[str | None]): Raw cmd arguments.
+            Expected: [].
         notebook (NoteBook): NoteBook object.
 
     Returns:
         str: Operation result message or by-tag sorted tables.
-
-    Raises:
-        InvalidCmdArgsCountError: If command has invalid argument count.
     """
+    if not notebook:
+        return "No Notes."
 
-    # Render all matched Notes
-    return render_notes_by_tags(notebook)
+    # Render all tagged Notes
+    return render_notes_by_tags(notebook.data.values()) or "No tagged Notes."
 
 
 @input_error
-def handle_encryption(args: list[str], config: dict) -> str:
+def handle_encryption(args: Sequence[str | None], config: dict[str, str | None]) -> str:
     """Handle encryption command.
 
     Activate/deactivate encryption for storage file.
 
     Args:
-        args (list[str]): List with raw cmd arguments.
+        args (Sequence[str | None]): Raw cmd arguments.
             Expected: [flag].
-        notebook (NoteBook): NoteBook object.
+        config (dict[str, str | None]): App config dict.
 
     Returns:
         str: Operation result message.
 
     Raises:
         InvalidCmdArgsCountError: If command has invalid argument count.
+        InvalidCmdArgTypeError: If flag value is not supported.
     """
-    try:
-        flag, *_ = args
-    except:
-        raise InvalidCmdArgsCountError
+    flag, = unpack_args(args, 1)
 
     flag = flag.lower();
     if flag == "on" and config["encryption_key"] is None:
@@ -797,7 +787,7 @@ def handle_encryption(args: list[str], config: dict) -> str:
     return f"Encryption status: {flag}."
 
 
-def load_store(path: str, cfg_path: str) -> dict:
+def load_store(path: str, cfg_path: str) -> dict | None:
     """Load app data from the encrypted/plain Pickle-serialized file.
 
     Args:
@@ -805,7 +795,7 @@ def load_store(path: str, cfg_path: str) -> dict:
         cfg_path (str): Path to the config file.
 
     Returns:
-        dict: Restored objects or empty objects on error.
+        dict | None: Restored or empty objects. None on unrecoverable error.
     """
     cfg = {"encryption_key": None}
     key = None
@@ -874,7 +864,7 @@ def load_store(path: str, cfg_path: str) -> dict:
 
 
 @file_error
-def save_store(data: dict, path: str, cfg_path: str) -> str:
+def save_store(data: dict, path: str, cfg_path: str) -> str | None:
     """Save app data to the encrypted/plain Pickle-serialized file.
 
     Args:
@@ -883,7 +873,7 @@ def save_store(data: dict, path: str, cfg_path: str) -> str:
         cfg_path (str): Path to the config file.
 
     Returns:
-        str: Operation result message.
+        str | None: Operation result message. None if config wasn't saved.
     """
     data["meta"]["NoteBook.id_iter"] = NoteBook.last_id
 
@@ -897,19 +887,38 @@ def save_store(data: dict, path: str, cfg_path: str) -> str:
         print(f"ERROR: There was a problem saving `{cfg_path}` config file.")
         return None
 
+    # Write into temp file first, so interrupted save doesn't corrupt existing data.
+    # Resolve symlink to replace its target instead of the link itself
+    real_path = os.path.realpath(path)
+    tmp_path = real_path + ".tmp"
     try:
-        with open(path, "wb") as fh:
+        with open(tmp_path, "wb") as fh:
+            # Keep permissions of existing store before any data is written
+            try:
+                os.fchmod(fh.fileno(), os.stat(real_path).st_mode & 0o7777)
+            except FileNotFoundError:
+                pass
             if key is None:
-                pickle.dump(data, fh)
+                pickle.dump(data, fh, protocol=pickle.HIGHEST_PROTOCOL)
             else:
                 # Create Fernet and encrypt
                 fernet = Fernet(key.encode())
-                serialized_data = pickle.dumps(data)
+                serialized_data = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
                 encrypted_data = fernet.encrypt(serialized_data)
                 fh.write(encrypted_data)
-
-    except OSError as e:
-        raise OSError(f"ERROR: Failed to save app data in `{path}` file.") from e
+            # Make sure data hits the disk before replacing, so power loss can't leave empty file
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, real_path)
+    except BaseException as e:
+        # Don't leave partially written temp file behind
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        if isinstance(e, OSError):
+            raise OSError(f"ERROR: Failed to save app data in `{path}` file.") from e
+        raise
     if key is None:
         return f"App data was saved in `{path}` file."
     return f"App data was encrypted and saved in `{path}` file."
@@ -1,11 +1,15 @@
-import csv
+import atexit
+import functools
+import os
 import sys
+from bisect import bisect_left
 from collections import defaultdict
+from collections.abc import Callable, Sequence
 
 try:
     import readline
 except ImportError:
-    pass
+    readline = None
 
 import core
 from man import render_help
@@ -13,6 +17,8 @@ from man import render_help
 
 STORE_PATH = "store.bin"
 CONFIG_PATH = "config.json"
+HISTORY_PATH = ".history"
+HISTORY_LENGTH = 1000
 MSG_BAD_ARG_COUNT = "Wrong number of arguments. Type `help` to read about command usage."
 CMD_CFG = {
     "exit": (0, 0),
@@ -36,6 +42,15 @@ CMD_CFG = {
     "encryption": (1, 1),
     "skip": (0, 0),
 }
+# Parsed args are padded with None up to the max number of args across all commands
+MAX_CMD_ARGS = max(max_count for _, max_count in CMD_CFG.values())
+# Bit `i` is set if command accepts `i` args
+CMD_ARGC_MASKS = {
+    cmd: sum(1 << i for i in range(min_count, max_count + 1))
+    for cmd, (min_count, max_count) in CMD_CFG.items()
+}
+# Commands which can be called without args
+NO_ARGS_CMDS = {cmd for cmd, (min_count, _) in CMD_CFG.items() if min_count == 0}
 
 CMD_SYNONYMS = {
     "exit": ["quit", "bye", "close"],
@@ -58,50 +73,174 @@ CMD_SYNONYMS = {
     "sort-by-tags": ["category"],
 }
 
+# Data command handlers: (function, app data store key, whether cmd name is passed first).
+# Store key also names the handler parameter which receives the store
+CMD_HANDLERS = {
+    "new-record": (core.handle_new_record, "book", False),
+    "records": (core.handle_records, "book", False),
+    "phone": (core.handle_phone, "book", False),
+    "address": (core.handle_record_prop, "book", True),
+    "email": (core.handle_record_prop, "book", True),
+    "birthday": (core.handle_record_prop, "book", True),
+    "photo": (core.handle_record_prop, "book", True),
+    "birthdays": (core.handle_birthdays, "book", False),
+    "find-records": (core.handle_find_records, "book", False),
+    "new-note": (core.handle_new_note, "notebook", False),
+    "notes": (core.handle_notes, "notebook", False),
+    "tag": (core.handle_tag, "notebook", False),
+    "find-notes": (core.handle_find_notes, "notebook", False),
+    "sort-by-tags": (core.handle_sort_by_tags, "notebook", False),
+    "encryption": (core.handle_encryption, "config", False),
+}
 
-def guess_cmd(cmd: str) -> list:
-    if len(set(cmd)) < 3:
-        return []
+# Data commands which never/always modify app data. Others modify it only when value arg is set
+READ_ONLY_CMDS = {"birthdays", "find-records", "find-notes", "sort-by-tags"}
+WRITE_CMDS = {"new-record", "new-note", "encryption"}
+
+
+def build_cmd_signatures(synonyms: dict[str, list[str]]) -> list[tuple[frozenset, tuple[str, ...], str]]:
+    """Build letter signatures for commands and their synonyms.
+
+    Args:
+        synonyms (dict[str, list[str]]): Command names mapped to their synonyms.
 
+    Returns:
+        list[tuple[frozenset, tuple[str, ...], str]]: Tuples of letter set,
+            matching command names and the word which produced the set.
+    """
     all_sigs = defaultdict(list)
     all_sig_names = {}
-    for real in CMD_SYNONYMS:
+    for real in synonyms:
         all_sigs[frozenset(real)].append(real)
         all_sig_names[frozenset(real)] = real
-        for syn in CMD_SYNONYMS[real]:
+        for syn in synonyms[real]:
             all_sigs[frozenset(syn)].append(real)
             all_sig_names[frozenset(syn)] = syn
 
-    match_scores = []
+    return [(sig, tuple(cmds), all_sig_names[sig]) for sig, cmds in all_sigs.items()]
+
+
+CMD_SIGNATURES = build_cmd_signatures(CMD_SYNONYMS)
+
+
+def common_prefix_len(a: str, b: str) -> int:
+    """Return length of the common prefix of two strings."""
+    for i, (char_a, char_b) in enumerate(zip(a, b)):
+        if char_a != char_b:
+            return i
+    return min(len(a), len(b))
+
+
+def guess_cmd(cmd: str) -> list:
+    if len(cmd) < 3:
+        return []
     input_sig = set(cmd)
-    for sig, cmds in all_sigs.items():
-        match_score = len(input_sig.intersection(sig))
-        match_scores.append((match_score, tuple(cmds), all_sig_names[sig]))
+    if len(input_sig) < 3:
+        return []
 
+    # Rank by shared letters, then by shared prefix, so letter order breaks ties
+    match_scores = [
+        (len(input_sig & sig), common_prefix_len(cmd, name), cmds, name)
+        for sig, cmds, name in CMD_SIGNATURES
+    ]
     match_scores.sort(reverse=True)
-    return [{"input": score[2], "cmds": score[1]} for score in match_scores if score[0] > 2]
+    return [{"input": score[3], "cmds": score[2]} for score in match_scores if score[0] > 2]
 
 
-def parse_input(user_input: str) -> tuple[str, list[str]]:
+def parse_input(user_input: str) -> tuple[str, tuple[str | None, ...]]:
     """Parse string into a tuple of command name and its arguments.
 
     Args:
         user_input (str): Input string.
 
     Returns:
-        tuple[str, list[str]: Tuple of command name and arguments list.
+        tuple[str, tuple[str | None, ...]]: Tuple of command name and
+            arguments padded with None up to `MAX_CMD_ARGS` items.
 
     Raises:
         ValueError: If user input has wrong number of arguments.
     """
     if not user_input:
-        return "", {}
+        return "", ()
+
+    user_input = user_input.strip()
+    # Bare command without args doesn't need tokenizing or validation
+    if user_input in NO_ARGS_CMDS:
+        return user_input, (None,) * MAX_CMD_ARGS
+
+    # Only quoted input needs tokenizing. Plain split on " " gives the same fields otherwise
+    tokens = tokenize(user_input) if '"' in user_input else user_input.split(" ")
+    return parse_tokens(tokens)
+
+
+def tokenize(line: str) -> list[str]:
+    """Split string by spaces respecting double-quoted fields.
+
+    Quote opens a field only at its start. Inside quoted field `""` stands
+    for a literal quote. Text after closing quote is glued to the field.
+
+    Args:
+        line (str): Input string.
+
+    Returns:
+        list[str]: List of fields.
+
+    Raises:
+        ValueError: If quoted field is not terminated.
+    """
+    tokens = []
+    buf = []
+    in_quote = False
+    at_start = True
+    i = 0
+    n = len(line)
+    while i < n:
+        char = line[i]
+        if in_quote:
+            if char != '"':
+                buf.append(char)
+            elif i + 1 < n and line[i + 1] == '"':
+                buf.append(char)
+                i += 1
+            else:
+                in_quote = False
+        elif char == " ":
+            tokens.append("".join(buf))
+            buf.clear()
+            at_start = True
+            i += 1
+            continue
+        elif char == '"' and at_start:
+            in_quote = True
+        else:
+            buf.append(char)
+        at_start = False
+        i += 1
+
+    if in_quote:
+        raise ValueError("Unterminated quote.")
+    tokens.append("".join(buf))
+    return tokens
+
+
+def parse_tokens(tokens: list[str]) -> tuple[str, tuple[str | None, ...]]:
+    """Parse tokenized input into a tuple of command name and its arguments.
 
-    args = [None] * 3  # With `3` being the max number of args across all commands
-    reader = csv.reader([user_input.strip()], delimiter=" ")
-    cmd, *input_args = next(reader)
-    cmd = cmd.lower()
-    if cmd not in CMD_CFG:
+    Args:
+        tokens (list[str]): Non-empty list of command name and raw arguments.
+
+    Returns:
+        tuple[str, tuple[str | None, ...]]: Tuple of command name and
+            arguments padded with None up to `MAX_CMD_ARGS` items.
+
+    Raises:
+        ValueError: If command is unknown or has wrong number of arguments.
+    """
+    cmd, *input_args = tokens
+    if not cmd.islower():
+        cmd = cmd.lower()
+    mask = CMD_ARGC_MASKS.get(cmd)
+    if mask is None:
         suggestions = guess_cmd(cmd)
         if not suggestions:
             raise ValueError("Unknown command.")
@@ -112,50 +251,188 @@ def parse_input(user_input: str) -> tuple[str, list[str]]:
         else:
             print(f"Did you mean typing: {", ".join(candidate["cmds"])}?")
         cmd = "skip"
+        mask = CMD_ARGC_MASKS[cmd]
 
-    if not CMD_CFG[cmd][0] <= len(input_args) <= CMD_CFG[cmd][1]:
+    if not mask & (1 << len(input_args)):
         raise ValueError(MSG_BAD_ARG_COUNT)
 
-    args[:len(input_args)] = input_args
-    return cmd, args
+    return cmd, (*input_args, *(None,) * (MAX_CMD_ARGS - len(input_args)))
 
 
-def main():
-    if len(sys.argv) == 1:
-        print("Welcome to the assistant bot!\nType `help` to learn more about available commands.")
-    data = core.load_store(STORE_PATH, CONFIG_PATH)
-    if data is None:
-        sys.exit(1)
+def make_completer(words: list[str]) -> Callable:
+    """Create readline completer for command names.
+
+    Args:
+        words (list[str]): Words available for completion.
+
+    Returns:
+        Callable: Completer function with `(text, state)` signature.
+    """
+    words = sorted(words)
+
+    def complete(text: str, state: int) -> str | None:
+        # Complete only the command name, not its arguments
+        if readline.get_begidx() != 0:
+            return None
+        i = bisect_left(words, text) + state
+        if i < len(words) and words[i].startswith(text):
+            return words[i]
+        return None
+    return complete
+
+
+def remove_history():
+    """Remove the history file if it exists."""
+    try:
+        os.remove(HISTORY_PATH)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        print(f"ERROR: There was a problem removing `{HISTORY_PATH}` history file.")
+
+
+def save_history(config: dict):
+    """Save readline input history into the history file.
 
-    # Store functions for easier command handling
-    cmd_funcs = {
-        "new-record": core.handle_new_record,
-        "new-note": core.handle_new_note,
-        "records": core.handle_records,
-        "notes": core.handle_notes,
-        "phone": core.handle_phone,
-        "address": core.handle_record_prop,
-        "email": core.handle_record_prop,
-        "birthday": core.handle_record_prop,
-        "photo": core.handle_record_prop,
-        "birthdays": core.handle_birthdays,
-        "find-records": core.handle_find_records,
-        "find-notes": core.handle_find_notes,
-        "tag": core.handle_tag,
-        "encryption": core.handle_encryption,
-        "sort-by-tags": core.handle_sort_by_tags,
-    }
+    Plaintext history would leak data which is stored encrypted, so the
+    history file is removed instead if encryption is on.
 
+    Args:
+        config (dict): App config.
+    """
+    if config["encryption_key"] is not None:
+        remove_history()
+        return
+    try:
+        readline.write_history_file(HISTORY_PATH)
+    except OSError:
+        print(f"ERROR: There was a problem saving `{HISTORY_PATH}` history file.")
+
+
+def setup_readline(config: dict):
+    """Enable command name completion and input history if readline is available.
+
+    History is persisted in the history file only while storage encryption is off.
+
+    Args:
+        config (dict): Loaded app config.
+    """
+    if readline is None:
+        return
+
+    # Limit how many entries are kept in the saved history file
+    readline.set_history_length(HISTORY_LENGTH)
+
+    # Load previous session history once, drop it if store is encrypted. Save or drop it on exit
+    if config["encryption_key"] is None:
+        try:
+            readline.read_history_file(HISTORY_PATH)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            print(f"ERROR: There was a problem reading `{HISTORY_PATH}` history file.")
+    else:
+        remove_history()
+    atexit.register(save_history, config)
+
+    # Command names contain `-`, which is a word delimiter by default
+    readline.set_completer_delims(" ")
+    readline.set_completer(make_completer([cmd for cmd in CMD_CFG if cmd != "skip"]))
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+        # Pasted multi-word values arrive as one chunk instead of keystroke by keystroke
+        readline.parse_and_bind("set enable-bracketed-paste on")
+
+
+def bind_handlers(data: dict) -> dict[str, Callable]:
+    """Bind data command handlers to their app data stores.
+
+    Args:
+        data (dict): Loaded app data.
+
+    Returns:
+        dict[str, Callable]: Command names mapped to handlers taking only args.
+    """
+    handlers = {}
+    for cmd, (func, store, pass_cmd) in CMD_HANDLERS.items():
+        if pass_cmd:
+            handlers[cmd] = functools.partial(func, cmd, **{store: data[store]})
+        else:
+            handlers[cmd] = functools.partial(func, **{store: data[store]})
+    return handlers
+
+
+def is_read_only(cmd: str, args: Sequence[str | None]) -> bool:
+    """Check if data command doesn't modify app data.
+
+    Args:
+        cmd (str): Command name.
+        args (Sequence[str | None]): Parsed command arguments.
+
+    Returns:
+        bool: True if command only reads app data. False otherwise.
+    """
+    if cmd in READ_ONLY_CMDS:
+        return True
+    if cmd in WRITE_CMDS:
+        return False
+    # View/edit commands: `<cmd> [<target>]` shows, `<cmd> <target> <value> ...` modifies
+    return args[1] is None
+
+
+def execute_cmd(cmd: str, args: Sequence[str | None], data: dict, handlers: dict[str, Callable]) -> bool:
+    """Execute parsed command and save app data if it was modified.
+
+    Args:
+        cmd (str): Command name.
+        args (Sequence[str | None]): Parsed command arguments.
+        data (dict): Loaded app data.
+        handlers (dict[str, Callable]): Bound data command handlers.
+
+    Returns:
+        bool: False if app should exit. True otherwise.
+    """
+    # Handle data commands
+    handler = handlers.get(cmd)
+    if handler is not None:
+        print(handler(args))
+        if not is_read_only(cmd, args):
+            core.save_store(data, STORE_PATH, CONFIG_PATH)
+        return True
+
+    # Handle system commands
+    match cmd:
+        case "exit" | "close":
+            print(core.save_store(data, STORE_PATH, CONFIG_PATH))
+            print("Exiting program. Good bye!")
+            return False
+        case "hello":
+            print("Hello! How can I help you?")
+        case "help":
+            print(render_help())
+        case "skip":
+            pass
+        case _:
+            print("ERROR: Unknown command. Try again.")
+    return True
+
+
+def run_interactive(data: dict, handlers: dict[str, Callable]):
+    """Read and execute commands until exit command or interrupt.
+
+    Args:
+        data (dict): Loaded app data.
+        handlers (dict[str, Callable]): Bound data command handlers.
+    """
     while True:
         # Handle empty input, interrupts and parse errors
         try:
-            if len(sys.argv) == 1:
-                cmd = input("> ")
-            else:
-                cmd = " ".join(sys.argv[1:])
-            if not cmd:
+            user_input = input("> ")
+            if not user_input:
                 continue
-            cmd, args = parse_input(cmd)
+            cmd, args = parse_input(user_input)
         except (KeyboardInterrupt, EOFError):
             print("\nProgram interrupted by user.")
             break
@@ -163,34 +440,44 @@ def main():
             print("ERROR:", e, "Try again.")
             continue
 
-        # Handle commands
-        match cmd:
-            case "exit" | "close":
-                print(core.save_store(data, STORE_PATH, CONFIG_PATH))
-                print("Exiting program. Good bye!")
-                break
-            case "hello":
-                print("Hello! How can I help you?")
-            case "help":
-                print(render_help())
-            case "new-record" | "records" | "birthdays" | "find-records" | "phone":
-                print(cmd_funcs[cmd](args, data["book"]))
-                core.save_store(data, STORE_PATH, CONFIG_PATH)
-            case "address" | "email" | "birthday" | "photo":
-                print(cmd_funcs[cmd](cmd, args, data["book"]))
-                core.save_store(data, STORE_PATH, CONFIG_PATH)
-            case "new-note" | "notes" | "find-notes" | "tag" | "sort-by-tags":
-                print(cmd_funcs[cmd](args, data["notebook"]))
-                core.save_store(data, STORE_PATH, CONFIG_PATH)
-            case "encryption":
-                print(cmd_funcs[cmd](args, data["config"]))
-                core.save_store(data, STORE_PATH, CONFIG_PATH)
-            case "skip":
-                continue
-            case _:
-                print("ERROR: Unknown command. Try again.")
-        if len(sys.argv) > 1:
+        if not execute_cmd(cmd, args, data, handlers):
             break
 
+
+def run_oneshot(argv: list[str], data: dict, handlers: dict[str, Callable]):
+    """Execute single command passed via command line arguments.
+
+    Args:
+        argv (list[str]): Command line arguments without script name.
+        data (dict): Loaded app data.
+        handlers (dict[str, Callable]): Bound data command handlers.
+    """
+    # Arguments are already split by the shell, so don't re-tokenize them
+    try:
+        cmd, args = parse_tokens(argv)
+    except ValueError as e:
+        print("ERROR:", e, "Try again.")
+        return
+
+    execute_cmd(cmd, args, data, handlers)
+
+
+def main():
+    interactive = len(sys.argv) == 1
+    if interactive:
+        print("Welcome to the assistant bot!\nType `help` to learn more about available commands.")
+    data = core.load_store(STORE_PATH, CONFIG_PATH)
+    if data is None:
+        sys.exit(1)
+    if interactive:
+        setup_readline(data["config"])
+    handlers = bind_handlers(data)
+
+    if interactive:
+        run_interactive(data, handlers)
+    else:
+        run_oneshot(sys.argv[1:], data, handlers)
+
+
 if __name__ == "__main__":
     main()
@@ -2,15 +2,10 @@ import itertools
 import re
 from collections import UserDict
 
+from contacts import Field, InvalidPropertyFormatError
 
-TAG_PATTERN = re.compile(r'^[a-zA-Z0-9 @#$%&._+-]{3,30}$')
 
-
-class InvalidPropertyFormatError(ValueError):
-    """Custom exception for invalid property format."""
-
-    def __init__(self, message="Invalid property format."):
-        super().__init__(message)
+TAG_PATTERN = re.compile(r'[a-zA-Z0-9 @#$%&._+-]{3,30}')
 
 
 class InvalidBodyFormatError(InvalidPropertyFormatError):
@@ -24,21 +19,25 @@ class InvalidTagFormatError(InvalidPropertyFormatError):
         super().__init__(message)
 
 
-class Field:
-    """Base class for storing Note fields.
+class SearchableField(Field):
+    """Base class for Note fields searchable case-insensitively.
 
-    Args:
-        value: Stored value of arbitary type.
+    Attributes:
+        value_lower (str): Lowercased value cached for search. Not pickled,
+            recomputed on load instead.
     """
 
-    def __init__(self, value):
-        self.value = value
+    def __getstate__(self) -> dict:
+        """Return pickled state without derived cache."""
+        return {k: v for k, v in self.__dict__.items() if k != "value_lower"}
 
-    def __str__(self):
-        return str(self.value)
+    def __setstate__(self, state: dict):
+        """Restore pickled object and recompute cache."""
+        self.__dict__.update(state)
+        self.value_lower = self.value.lower()
 
 
-class Body(Field):
+class Body(SearchableField):
     """Field class for storing Note body field."""
 
     def __init__(self, value: str):
@@ -48,9 +47,10 @@ class Body(Field):
         if len(value) > 300:
             raise InvalidBodyFormatError
         self.value = value
+        self.value_lower = value.lower()
 
 
-class Tag(Field):
+class Tag(SearchableField):
     """Field class for storing Note tag field.
 
     Equality:
@@ -80,9 +80,10 @@ class Tag(Field):
             InvalidTagFormatError: If tag format is invalid.
         """
         value = value.strip()
-        if not (3 <= len(value) <= 30) or not TAG_PATTERN.match(value):
+        if not TAG_PATTERN.fullmatch(value):
             raise InvalidTagFormatError
         self.value = value
+        self.value_lower = value.lower()
 
 
 class Note:
@@ -104,8 +105,9 @@ class Note:
         self.tags = tags.copy() if tags else []
 
     def __str__(self):
-        tags = ', '.join(self.tags)
-        return f"Note #{self.id}: {self.body[:50]}{'...' if len(self.body) > 50 else ''} [{tags}]"
+        body = self.body.value
+        tags = ', '.join(tag.value for tag in self.tags)
+        return f"Note #{self.id}: {body[:50]}{'...' if len(body) > 50 else ''} [{tags}]"
 
     def set_body(self, value: str):
         """Set body text for the note.
@@ -242,14 +244,17 @@ class NoteBook(UserDict):
             search_value (str): Matching value to find.
 
         Returns:
-            list[Note]: List of matched Notes.
+            dict[int, Note]: Matched Notes by ID.
         """
         notes = {}
         search_value = search_value.lower()
-        for note in self.values():
-            if (
-                search_value in note.body.value.lower() or
-                any(search_value in tag.value.lower() for tag in note.tags)
-            ):
+        for note in self.data.values():
+            if search_value in note.body.value_lower:
                 notes[note.id] = note
+                continue
+            # Plain loop avoids building `any()` generator per Note
+            for tag in note.tags:
+                if search_value in tag.value_lower:
+                    notes[note.id] = note
+                    break
         return notes
@@ -1,3 +1,5 @@
+import functools
+
 from ascii_magic import AsciiArt
 
 
@@ -22,7 +24,23 @@ def hex_to_rgb(val: str) -> tuple[int, int, int]:
     Returns:
         tuple[int, int, int]: RGB tuple.
     """
-    return int(val[1:3], 16), int(val[3:5], 16), int(val[5:7], 16)
+    r, g, b = bytes.fromhex(val[1:7])
+    return r, g, b
+
+
+@functools.lru_cache(maxsize=4096)
+def get_truecolor_prefix(val: str) -> str:
+    """Return escape sequence setting both bg and fg to hex color.
+
+    Args:
+        val (str): Hex color string.
+
+    Returns:
+        str: ANSI truecolor escape sequence.
+    """
+    r, g, b = hex_to_rgb(val)
+    # Foreground: `\x1b[38;2;`. Background: `\x1b[48;2;`
+    return f"\x1b[48;2;{r};{g};{b}m\x1b[38;2;{r};{g};{b}m"
 
 
 def get_truecolor_string(art: AsciiArt, **kwargs) -> str:
@@ -36,12 +54,8 @@ def get_truecolor_string(art: AsciiArt, **kwargs) -> str:
     """
     char_rows = art.to_character_list(full_color=True, **kwargs)
 
-    output = ""
-    for row in char_rows:
-        for cell in row:
-            r, g, b = hex_to_rgb(cell["full-hex-color"])
-            # Foreground: `\x1b[38;2;`. Background: `\x1b[48;2;`
-            output += f"\x1b[48;2;{r};{g};{b}m\x1b[38;2;{r};{g};{b}m{cell['character']}"
-        # Reset all after final char of each row
-        output += "\x1b[0m\n"
-    return output
+    # Reset all after final char of each row
+    return "".join(
+        "".join([get_truecolor_prefix(cell["full-hex-color"]) + cell["character"] for cell in row]) + "\x1b[0m\n"
+        for row in char_rows
+    )